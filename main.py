@@ -3,15 +3,17 @@ import time
 import json
 import os
 import subprocess
+import re
 from pathlib import Path
+# KEY=VALUE lines; comments and blank lines never match the key pattern
+ENV_LINE_RE = re.compile(rb'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=(.*)$', re.MULTILINE)
+
 def load_env_file(path):
     """Simple replacement for load_dotenv to avoid external dependency."""
     if not os.path.exists(path): return
-    with open(path, 'r') as f:
-        for line in f:
-            if '=' in line:
-                key, val = line.strip().split('=', 1)
-                os.environ[key] = val
+    content = Path(path).read_bytes()
+    for key, val in ENV_LINE_RE.findall(content):
+        os.environ[key.decode()] = val.strip().decode()
 
 # Add project root to path
 sys.path.append(os.path.dirname(__file__))
@@ -19,11 +21,13 @@ sys.path.append(os.path.dirname(__file__))
 from src.services.api_client import RvmApiClient
 from src.hardware.hardware_manager import HardwareManager
 from src.utils.browser_manager import BrowserManager
+from src.hardware.level_math import calculate_level
 
 # Constants
 BASE_DIR = Path(__file__).parent
 CONFIG_DIR = BASE_DIR / "config"
 SECRETS_PATH = CONFIG_DIR / "secrets.env"
+SERVER_URL = "https://myrvm.penelitian.my.id/api/v1" # Default URL from spec
 
 def get_device_info():
     """Extracts physical hardware serial and model name (Jetson/Pi)."""
@@ -72,9 +76,11 @@ def run_setup_wizard():
     print("[*] Please upload rvm-credentials.json to provision.")
     
     try:
-        # Run uvicorn as a subprocess using the current python interpreter
+        # Run the wizard as a subprocess using the current python interpreter.
+        # Its __main__ owns the uvicorn.Server so it can exit via should_exit.
         subprocess.run(
-            [sys.executable, "-m", "uvicorn", "src.setup_wizard.app:app", "--host", "0.0.0.0", "--port", "8080"], 
+            [sys.executable, "-m", "src.setup_wizard.app"],
+            cwd=BASE_DIR,
             check=True
         )
     except KeyboardInterrupt:
@@ -147,11 +153,8 @@ def main():
     print(f"[*] Controller: {model}")
     
     # 4. Initialize API Client
-    # Default URL from spec
-    server_url = "https://myrvm.penelitian.my.id/api/v1" 
-    
     client = RvmApiClient(
-        base_url=server_url, 
+        base_url=SERVER_URL, 
         api_key=api_key,
         device_id=serial_number # Using Logical Serial from JSON
     )
@@ -202,9 +205,8 @@ def main():
             if bin_driver:
                 distance = bin_driver.read()
                 if distance:
-                    # Logic: Smaller distance = fuller bin.
-                    # Assume 50cm is empty, 5cm is full.
-                    bin_level = max(0, min(100, int((50 - distance) / 45 * 100)))
+                    # Logic: Smaller distance = fuller bin (50cm empty, 5cm full).
+                    bin_level = calculate_level(distance)
                     print(f"[.] Bin Distance: {distance} cm -> {bin_level}% full")
             
             # Dynamic Hardware Probe
@@ -0,0 +1,13 @@
+# Ultrasonic bin level: smaller distance = fuller bin.
+# Assume 50cm is empty, 5cm is full.
+EMPTY_DISTANCE_CM = 50.0
+FULL_DISTANCE_CM = 5.0
+_SPAN_CM = EMPTY_DISTANCE_CM - FULL_DISTANCE_CM
+
+def calculate_level(distance):
+    """
+    Scalar bin fill level (0-100 %) for one distance reading in cm.
+    Plain Python on purpose: main.py imports this at boot, so it pulls in no
+    numpy/numba (see level_math_np for the vectorized form).
+    """
+    return max(0, min(100, int((EMPTY_DISTANCE_CM - distance) / _SPAN_CM * 100.0)))
@@ -0,0 +1,13 @@
+import numpy as np
+
+from .level_math import EMPTY_DISTANCE_CM, FULL_DISTANCE_CM
+
+def compute_level(distances):
+    """
+    Vectorized bin fill level (0-100 %) for an array of distances in cm.
+    Matches level_math.calculate_level() element-wise; kept in its own module
+    so the scalar path used by main.py does not import numpy.
+    """
+    distances = np.asarray(distances, dtype=np.float64)
+    levels = ((EMPTY_DISTANCE_CM - distances) / (EMPTY_DISTANCE_CM - FULL_DISTANCE_CM) * 100.0).astype(np.int64)
+    return np.clip(levels, 0, 100)
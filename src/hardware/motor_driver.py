@@ -18,6 +18,25 @@ except ImportError:
 
 from .base_driver import BaseDriver
 
+def _pulse_loop(output, sleep, step_pin, n_steps, delay, high, low):
+    """
+    STEP pulse train for step/dir drivers (TB6600).
+    output/sleep are passed in so the hot loop only touches locals.
+    """
+    for _ in range(n_steps):
+        output(step_pin, high)
+        sleep(delay)
+        output(step_pin, low)
+        sleep(delay)
+
+def _phase_loop(output, sleep, pins, sequence, n_steps, delay):
+    """Half-step phase sequence for 4-wire steppers (28BYJ-48 with ULN2003)."""
+    seq_len = len(sequence)
+    for i in range(n_steps):
+        for pin, level in zip(pins, sequence[i % seq_len]):
+            output(pin, level)
+        sleep(delay)
+
 class StepperDriver(BaseDriver):
     """
     Driver for Stepper Motors (NEMA17 with TB6600 or 28BYJ-48 with ULN2003).
@@ -80,21 +99,10 @@ class StepperDriver(BaseDriver):
 
         if self.model == "nema17":
             GPIO.output(self.pins['dir'], direction)
-            for _ in range(abs(steps)):
-                GPIO.output(self.pins['step'], GPIO.HIGH)
-                time.sleep(speed)
-                GPIO.output(self.pins['step'], GPIO.LOW)
-                time.sleep(speed)
+            _pulse_loop(GPIO.output, time.sleep, self.pins['step'], abs(steps), speed, GPIO.HIGH, GPIO.LOW)
         else:
-            # 28BYJ-48 Half-step sequence
-            step_count = len(self.step_sequence)
-            direction_multiplier = 1 if direction == 1 else -1
-            
-            for i in range(abs(steps)):
-                for pin_idx, pin in enumerate(list(self.pins.values())):
-                    # Use sequence index correctly
-                    GPIO.output(pin, self.step_sequence[i % step_count][pin_idx])
-                time.sleep(speed)
+            # 28BYJ-48 Half-step sequence (pin list built once, not per step)
+            _phase_loop(GPIO.output, time.sleep, list(self.pins.values()), self.step_sequence, abs(steps), speed)
 
     def cleanup(self):
         if GPIO:
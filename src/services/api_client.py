@@ -5,9 +5,19 @@ import os
 import platform
 import subprocess
 import glob
+import zlib
+
+# Fast JSON encoding for request bodies; stdlib fallback yields the same bytes shape
+try:
+    import orjson
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
 
 class RvmApiClient:
-    def __init__(self, base_url, api_key, device_id, name=None):
+    def __init__(self, base_url, api_key, device_id, name=None, compress_sync=False):
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.device_id = device_id
@@ -18,6 +28,8 @@ class RvmApiClient:
             'Accept': 'application/json'
         })
         self.machine_info = {}
+        # Gzip sync-offline bodies only once the server is known to accept Content-Encoding: gzip
+        self.compress_sync = compress_sync
         
         # Load Version
         self.version = "1.1.0"
@@ -126,11 +138,18 @@ class RvmApiClient:
     def sync_offline(self, transactions):
         """
         Bulk uploads offline transactions.
+        `transactions` may be any iterable (e.g. a generator over stored rows);
+        the body is streamed one transaction at a time so the full payload is
+        never held in memory. With `compress_sync` the stream is also gzipped.
         """
         endpoint = f"{self.base_url}/edge/sync-offline"
         try:
-            payload = {"transactions": transactions}
-            response = self.session.post(endpoint, json=payload, timeout=20)
+            body = self._iter_sync_body(transactions)
+            headers = {'Content-Type': 'application/json'}
+            if self.compress_sync:
+                body = self._gzip_stream(body)
+                headers['Content-Encoding'] = 'gzip'
+            response = self.session.post(endpoint, data=body, headers=headers, timeout=20)
             response.raise_for_status()
             print(f"[+] Offline Sync Success: {response.json().get('synced_count')} items")
             return True
@@ -156,11 +175,13 @@ class RvmApiClient:
                 "tailscale_ip": self._get_tailscale_ip()
             }
             
-            # DEBUG: Print Payload to Console
-            print(f"[DEBUG] Heartbeat Payload: {json.dumps(payload, indent=2)}")
-            
             # Heartbeat is lightweight, short timeout
-            response = self.session.post(endpoint, json=payload, timeout=5)
+            response = self.session.post(
+                endpoint,
+                data=_dumps(payload),
+                headers={'Content-Type': 'application/json'},
+                timeout=5
+            )
             response.raise_for_status()
             
             data = response.json()
@@ -174,6 +195,24 @@ class RvmApiClient:
 
     # ========== Helper Methods ==========
 
+    def _iter_sync_body(self, transactions):
+        """Yield the sync-offline JSON body one transaction at a time (chunked upload)."""
+        yield b'{"transactions":['
+        for i, txn in enumerate(transactions):
+            if i:
+                yield b','
+            yield _dumps(txn)
+        yield b']}'
+
+    def _gzip_stream(self, chunks, level=1):
+        """Gzip-compress an iterable of byte chunks on the fly (level 1 keeps ARM CPU cost low)."""
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits=31 -> gzip container
+        for chunk in chunks:
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
+
     def _get_ip(self):
         """Get local IP address."""
         try:
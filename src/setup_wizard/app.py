@@ -1,34 +1,60 @@
-from fastapi import FastAPI, Request, UploadFile, File, Form, HTTPException
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
+import asyncio
 import json
 import os
 from pathlib import Path
 import uvicorn
 import signal
-import threading
+import tempfile
 import time
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Paths
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
+MODULE_DIR = Path(__file__).resolve().parent
+BASE_DIR = MODULE_DIR.parent.parent
 CONFIG_DIR = BASE_DIR / "config"
-TEMPLATES_DIR = Path(__file__).parent / "templates"
+TEMPLATES_DIR = MODULE_DIR / "templates"
+
+# index.html has no template variables; read it once instead of per pageview
+INDEX_BYTES = (TEMPLATES_DIR / "index.html").read_bytes()
+
+# Credentials JSON is tiny; cap uploads so a large file can't exhaust RAM
+MAX_UPLOAD_SIZE = 64 * 1024
+UPLOAD_CHUNK_SIZE = 8 * 1024
+REQUIRED_FIELDS = ("serial_number", "api_key", "name")
 
 # Ensure config dir exists
 CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
 app = FastAPI(title="MyRVM Setup Wizard")
-templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+
+# uvicorn.Server instance, set when launched via __main__
+server = None
+_shutdown_task = None
+
+async def graceful_shutdown():
+    """Stop the server after a short delay so the success response reaches the browser"""
+    await asyncio.sleep(2)
+    if server is not None:
+        server.should_exit = True
+    else:
+        # Launched via the uvicorn CLI; no Server handle to flag
+        os.kill(os.getpid(), signal.SIGINT)
 
 def shutdown():
-    """Shutdown the server after a short delay"""
-    time.sleep(2)
-    os.kill(os.getpid(), signal.SIGINT)
+    """Schedule a single graceful shutdown; concurrent successful POSTs share it"""
+    global _shutdown_task
+    if _shutdown_task is None:
+        _shutdown_task = asyncio.create_task(graceful_shutdown())
 
 @app.get("/", response_class=HTMLResponse)
-async def index(request: Request):
-    return templates.TemplateResponse("index.html", {"request": request})
+async def index():
+    return HTMLResponse(INDEX_BYTES)
 
 @app.post("/upload")
 async def upload_config(file: UploadFile = File(...)):
@@ -36,22 +62,25 @@ async def upload_config(file: UploadFile = File(...)):
         raise HTTPException(status_code=400, detail="Only JSON files allowed")
     
     try:
-        content = await file.read()
-        data = json.loads(content)
+        content = bytearray()
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            content += chunk
+            if len(content) > MAX_UPLOAD_SIZE:
+                raise HTTPException(status_code=413, detail="File too large")
+        data = orjson.loads(content) if orjson else json.loads(content)
         
         # Validate Structure
-        required_fields = ["serial_number", "api_key", "name"]
-        for field in required_fields:
-            if field not in data:
-                raise HTTPException(status_code=400, detail=f"Missing required field: {field}")
+        validate_credentials(data)
         
         # Write to secrets.env
-        save_credentials(data)
+        await asyncio.to_thread(save_credentials, data)
         
         # Trigger shutdown in background
-        threading.Thread(target=shutdown).start()
+        shutdown()
         
         return {"status": "success", "message": "Credentials imported successfully. Restarting service..."}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -69,22 +98,53 @@ async def manual_config(
         }
         
         # Write to secrets.env
-        save_credentials(data)
+        await asyncio.to_thread(save_credentials, data)
         
         # Trigger shutdown in background
-        threading.Thread(target=shutdown).start()
+        shutdown()
         
         return {"status": "success", "message": "Manual setup successful. Restarting service..."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def validate_credentials(data):
+    """Raise a 400 if the uploaded credentials are not an object with all required fields"""
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=400, detail="Credentials file must contain a JSON object")
+    missing = [field for field in REQUIRED_FIELDS if field not in data]
+    if missing:
+        raise HTTPException(status_code=400, detail=f"Missing required field: {missing[0]}")
+
 def save_credentials(data):
+    """Write credentials to secrets.env (blocking, run via asyncio.to_thread)"""
     env_path = CONFIG_DIR / "secrets.env"
-    with open(env_path, "w") as f:
-        f.write(f"RVM_SERIAL_NUMBER={data['serial_number']}\n")
-        f.write(f"RVM_API_KEY={data['api_key']}\n")
-        f.write(f"RVM_NAME={data['name']}\n")
-        f.write(f"RVM_GENERATED_AT={data.get('generated_at', time.strftime('%Y-%m-%d %H:%M:%S'))}\n")
+    content = (
+        f"RVM_SERIAL_NUMBER={data['serial_number']}\n"
+        f"RVM_API_KEY={data['api_key']}\n"
+        f"RVM_NAME={data['name']}\n"
+        f"RVM_GENERATED_AT={data.get('generated_at', time.strftime('%Y-%m-%d %H:%M:%S'))}\n"
+    ).encode()
+    # Atomic write: a power cut mid-write must not leave a truncated secrets.env.
+    # The temp file is unique per call so concurrent uploads never share it.
+    fd, tmp_path = tempfile.mkstemp(dir=CONFIG_DIR, prefix=".secrets.env.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, env_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    dir_fd = os.open(CONFIG_DIR, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    server = uvicorn.Server(uvicorn.Config(app, host="0.0.0.0", port=8080))
+    server.run()
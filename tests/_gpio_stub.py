@@ -0,0 +1,33 @@
+"""
+Minimal stand-in for RPi.GPIO / Jetson.GPIO used by the mock test scripts.
+
+Exposes only what the hardware drivers touch, so attribute access is a plain
+class lookup instead of MagicMock synthesizing a child mock per attribute.
+"""
+import sys
+import types
+
+
+class GPIO:
+    BCM = 11
+    BOARD = 10
+    OUT = 0
+    IN = 1
+    LOW = 0
+    HIGH = 1
+
+    setwarnings = staticmethod(lambda flag: None)
+    setmode = staticmethod(lambda mode: None)
+    setup = staticmethod(lambda *args, **kwargs: None)
+    output = staticmethod(lambda *args: None)
+    input = staticmethod(lambda pin: 0)
+    cleanup = staticmethod(lambda *args: None)
+
+
+def install():
+    """Register the stub as RPi.GPIO and Jetson.GPIO (call before importing drivers)."""
+    for parent in ("RPi", "Jetson"):
+        package = types.ModuleType(parent)
+        package.GPIO = GPIO
+        sys.modules[parent] = package
+        sys.modules[f"{parent}.GPIO"] = GPIO
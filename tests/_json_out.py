@@ -0,0 +1,60 @@
+"""
+JSON printing shared by the handshake/payload test scripts.
+
+Uses orjson when installed, writing straight to stdout's binary buffer;
+otherwise falls back to the stdlib encoder with the same 2-space indent.
+"""
+import json
+import sys
+from datetime import date, datetime
+from decimal import Decimal
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Fallback encoder; options are fixed here, never changed per call.
+# ensure_ascii=False writes non-ASCII (e.g. "°C") as-is, like orjson does.
+_encode = json.JSONEncoder(indent=2, ensure_ascii=False).encode
+
+# Banner separators
+BAR = "=" * 60
+BAR70 = "=" * 70
+BANNER70 = "\n" + BAR70 + "\n"
+DASH = "-" * 60
+
+
+def coerce(x):
+    """Recursively turn datetime/Decimal values into str so encoders need no default hook."""
+    if isinstance(x, dict):
+        return {k: coerce(v) for k, v in x.items()}
+    if isinstance(x, (list, tuple)):
+        return [coerce(v) for v in x]
+    if isinstance(x, (datetime, date, Decimal)):
+        return str(x)
+    return x
+
+
+def write_json(data, banner=b""):
+    """
+    Write `banner` followed by `data` as indented JSON.
+    Pass a constant banner pre-encoded as bytes so it is not re-encoded per call.
+    """
+    if isinstance(banner, str):
+        banner = banner.encode()
+    if orjson:
+        # Flush pending text first so the binary write keeps its place in the output
+        sys.stdout.flush()
+        out = sys.stdout.buffer
+        out.write(banner)
+        out.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        out.write(b"\n")
+        out.flush()
+    else:
+        sys.stdout.write(banner.decode() + _encode(data) + "\n")
+
+
+def print_json(data, title=""):
+    """Pretty print JSON data (coerced first), under a BAR-framed title when one is given."""
+    write_json(coerce(data), f"\n{BAR}\n  {title}\n{BAR}\n" if title else "")
@@ -0,0 +1,151 @@
+"""
+Immutable mock hardware definitions for the handshake mock tests.
+
+Built once at import as frozen, slotted dataclasses; as_payload_dict()
+turns one into the handshake JSON shape, dropping fields left as None.
+"""
+from dataclasses import dataclass, asdict
+
+
+@dataclass(frozen=True, slots=True)
+class Microcontroller:
+    type: str
+    connection: str
+    port: str
+    baud_rate: int
+    status: str
+
+
+@dataclass(frozen=True, slots=True)
+class Camera:
+    id: int
+    path: str
+    name: str
+    connection_type: str
+    physical_location: str
+    serial_number: str
+    status: str
+    capabilities: dict
+    role: str
+
+
+@dataclass(frozen=True, slots=True)
+class Sensor:
+    name: str
+    friendly_name: str
+    model: str
+    interface: str
+    pins: dict = None
+    pin: int = None
+    active_level: str = None
+    status: str = None
+    last_reading: str = None
+    unit: str = None
+
+
+@dataclass(frozen=True, slots=True)
+class Actuator:
+    name: str
+    friendly_name: str
+    model: str
+    interface: str
+    driver: str = None
+    pins: dict = None
+    pin: int = None
+    last_reading: str = None
+    status: str = None
+
+
+def as_payload_dict(item):
+    """Dataclass -> payload dict (field order kept, unset fields omitted)."""
+    return asdict(item, dict_factory=lambda fields: {k: v for k, v in fields if v is not None})
+
+
+MICROCONTROLLER = Microcontroller(
+    type="MOCK-ESP32",
+    connection="MOCK-UART",
+    port="/dev/MOCK-ttyTHS1",
+    baud_rate=115200,
+    status="MOCK-connected",
+)
+
+CAMERAS = (
+    Camera(
+        id=0,
+        path="/dev/MOCK-video0",
+        name="MOCK Logitech C920",
+        connection_type="MOCK-USB",
+        physical_location="MOCK-usb-1.4:1.0",
+        serial_number="MOCK-SN-8F21",
+        status="MOCK-ready",
+        capabilities={
+            "max_resolution": "1920x1080",
+            "format": "MJPG",
+            "fps": 30
+        },
+        role="object_detection",
+    ),
+)
+
+SENSORS = (
+    Sensor(
+        name="MOCK_bin_ultrasonic",
+        friendly_name="MOCK Sensor Level Bak",
+        model="MOCK-HC-SR04",
+        interface="GPIO",
+        pins={"trigger": 12, "echo": 13},
+        status="MOCK-online",
+        last_reading="50",
+        unit="cm",
+    ),
+    Sensor(
+        name="MOCK_intake_proximity",
+        friendly_name="MOCK Sensor Deteksi Masuk",
+        model="MOCK-IR-Obstacle",
+        interface="GPIO",
+        pin=18,
+        active_level="LOW",
+        status="MOCK-online",
+        last_reading="0",
+        unit="boolean",
+    ),
+    Sensor(
+        name="MOCK_internal_temp",
+        friendly_name="MOCK Sensor Suhu Internal",
+        model="MOCK-DHT22",
+        interface="GPIO",
+        pin=4,
+        status="MOCK-online",
+        last_reading="28.5",
+        unit="°C",
+    ),
+)
+
+ACTUATORS = (
+    Actuator(
+        name="MOCK_sorting_motor",
+        friendly_name="MOCK Motor Pemilah",
+        model="MOCK-Stepper-NEMA17",
+        interface="GPIO",
+        driver="TB6600",
+        pins={"step": 23, "dir": 24, "enable": 25},
+        status="MOCK-ok",
+    ),
+    Actuator(
+        name="MOCK_door_lock",
+        friendly_name="MOCK Kunci Pintu",
+        model="MOCK-Solenoid-12V",
+        interface="GPIO",
+        pin=27,
+        status="MOCK-ok",
+    ),
+    Actuator(
+        name="MOCK_status_led",
+        friendly_name="MOCK Lampu Indikator",
+        model="MOCK-RGB-LED-Strip",
+        interface="GPIO",
+        pin=10,
+        last_reading="green",
+        status="MOCK-ok",
+    ),
+)
@@ -0,0 +1,25 @@
+"""
+Shared pytest setup for the Edge tests.
+
+Puts the project root on sys.path for `src.*` imports in pure pytest modules
+such as test_level_math; scripts that are also run directly carry their own
+one-line path setup.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+sys.path.insert(0, str(ROOT_DIR))
+
+# Scripts that talk to a live server at import time; run them by hand only
+collect_ignore = ["test_heartbeat.py", "test_handshake_live.py"]
+
+
+@pytest.fixture(scope="session")
+def mock_client():
+    """One offline API client shared by every test in the session."""
+    from src.services.api_client import RvmApiClient
+    return RvmApiClient("http://localhost", "test_key", "DEVICE_123")
@@ -2,9 +2,10 @@ import sys
 import os
 import json
 import time
+from pathlib import Path
 
-# Add parent directory to path to import src
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from src.services.api_client import RvmApiClient
 
@@ -1,10 +1,10 @@
 import time
 import sys
-import os
 from unittest.mock import MagicMock
+from pathlib import Path
 
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 # Standard Mock Check (following mock-data-consistency.md)
 try:
@@ -16,8 +16,10 @@ except ImportError:
     sys.modules["RPi.GPIO"] = mock_gpio
     sys.modules["Jetson"] = MagicMock()
     sys.modules["Jetson.GPIO"] = mock_gpio
+    SIMULATION = True
     print("[MOCK] GPIO hardware not detected. Running in SIMULATION mode.")
 else:
+    SIMULATION = False
     print("[HARDWARE] GPIO detected. Running in PHYSICAL mode.")
 
 from src.hardware.hardware_manager import HardwareManager
@@ -31,16 +33,17 @@ def mock_run_stress_test(duration_minutes=10, interval_seconds=2):
     bin_driver = mgr.get_driver('bin_ultrasonic')
     iterations = int((duration_minutes * 60) / interval_seconds)
     
+    # Following mock-data-consistency.md: all output includes clear indicator
+    # (the GPIO mode is fixed at import, so resolve it once instead of per iteration)
+    p_type = "[MOCK]" if SIMULATION else "[REAL]"
+    
     start_time = time.time()
     
     try:
         for i in range(iterations):
-            current_time = time.ctime()
             if bin_driver:
                 val = bin_driver.read()
-                # Following mock-data-consistency.md: all output includes clear indicator
-                p_type = "[MOCK]" if "MagicMock" in str(type(bin_driver)) else "[REAL]"
-                print(f"{p_type} [{current_time}] Iteration {i+1}/{iterations}: Bin Distance: {val} cm")
+                print(f"{p_type} [{time.strftime('%H:%M:%S')}] Iteration {i+1}/{iterations}: Bin Distance: {val} cm")
             
             # Simple heartbeat log
             if (i+1) % 30 == 0:
@@ -0,0 +1,52 @@
+import gzip
+import json
+
+import pytest
+
+from src.services.api_client import RvmApiClient
+
+TRANSACTIONS = [
+    {"id": 1, "item": "bottle", "weight_g": 24.5},
+    {"id": 2, "item": "can", "weight_g": 15.0},
+]
+
+
+@pytest.mark.parametrize("make_input", [
+    lambda: list(TRANSACTIONS),
+    lambda: (txn for txn in TRANSACTIONS),
+    lambda: [],
+], ids=["list", "generator", "empty"])
+def test_sync_body_round_trip(mock_client, make_input):
+    expected = list(make_input())
+    body = b"".join(mock_client._iter_sync_body(make_input()))
+    assert json.loads(body) == {"transactions": expected}
+
+
+class _RecordingSession:
+    """Stands in for requests.Session; keeps the last post and answers success."""
+    def post(self, url, data, headers, timeout):
+        self.url, self.body, self.headers = url, b"".join(data), headers
+        return self
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"synced_count": len(TRANSACTIONS)}
+
+
+@pytest.mark.parametrize("compress", [False, True], ids=["plain", "gzip"])
+def test_sync_offline_body_and_headers(compress):
+    client = RvmApiClient("http://localhost", "test_key", "DEVICE_123", compress_sync=compress)
+    client.session = sent = _RecordingSession()
+    assert client.sync_offline(iter(TRANSACTIONS))
+
+    assert sent.url == "http://localhost/edge/sync-offline"
+    assert sent.headers["Content-Type"] == "application/json"
+    body = sent.body
+    if compress:
+        assert sent.headers["Content-Encoding"] == "gzip"
+        body = gzip.decompress(body)
+    else:
+        assert "Content-Encoding" not in sent.headers
+    assert json.loads(body) == {"transactions": TRANSACTIONS}
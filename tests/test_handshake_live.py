@@ -1,13 +1,12 @@
 import sys
-import os
 import json
+from pathlib import Path
 
-# Add src to path
-sys.path.append(os.path.join(os.getcwd(), 'src'))
-sys.path.append(os.path.join(os.getcwd(), 'MyRVM-Edge/src'))
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 try:
-    from services.api_client import RvmApiClient
+    from src.services.api_client import RvmApiClient
 except ImportError:
     print("Failed to import RvmApiClient")
     sys.exit(1)
@@ -9,20 +9,13 @@ untuk field yang tidak terdeteksi (cameras, sensors, MCU).
 import sys
 import os
 import json
+from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from src.services.api_client import RvmApiClient
-
-
-def print_json(data, title=""):
-    """Pretty print JSON data."""
-    if title:
-        print(f"\n{'='*60}")
-        print(f"  {title}")
-        print(f"{'='*60}")
-    print(json.dumps(data, indent=2, default=str))
+from _json_out import BAR70, BANNER70, print_json
 
 
 def run_mock_handshake_test():
@@ -30,9 +23,7 @@ def run_mock_handshake_test():
     Test handshake dengan mock data.
     Jika field tidak terdeteksi, akan menggunakan placeholder.
     """
-    print("\n" + "="*70)
-    print("  MOCK HANDSHAKE TEST - RVM-Edge")
-    print("="*70)
+    print(BANNER70 + "  MOCK HANDSHAKE TEST - RVM-Edge\n" + BAR70)
     
     # Load credentials if available, otherwise use mock
     config_dir = os.path.join(os.path.dirname(__file__), '..', 'config')
@@ -98,9 +89,7 @@ def run_mock_handshake_test():
     print_json(full_payload, "FULL HANDSHAKE PAYLOAD")
     
     # Ask user whether to send to server
-    print("\n" + "="*70)
-    print("  Payload siap dikirim ke server.")
-    print("="*70)
+    print(BANNER70 + "  Payload siap dikirim ke server.\n" + BAR70)
     
     send = input("\nKirim payload ke server? (y/n): ").strip().lower()
     
@@ -116,18 +105,14 @@ def run_mock_handshake_test():
     else:
         print("\n[*] Skipped sending to server.")
     
-    print("\n" + "="*70)
-    print("  TEST COMPLETED")
-    print("="*70 + "\n")
+    print(BANNER70 + "  TEST COMPLETED\n" + BAR70 + "\n")
 
 
 def run_dry_test():
     """
     Dry run - hanya tampilkan payload tanpa kirim.
     """
-    print("\n" + "="*70)
-    print("  DRY RUN HANDSHAKE TEST - RVM-Edge")
-    print("="*70)
+    print(BANNER70 + "  DRY RUN HANDSHAKE TEST - RVM-Edge\n" + BAR70)
     
     config_dir = os.path.join(os.path.dirname(__file__), '..', 'config')
     
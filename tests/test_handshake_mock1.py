@@ -3,26 +3,66 @@
 Mock Handshake Test - Tests handshake with placeholder data
 Uses mock values when actual hardware is not detected.
 
-Run: python tests/test_handshake_mock.py
+Run: python tests/test_handshake_mock1.py  (or via pytest)
 """
 
 import sys
-import os
+import functools
+import types
+from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from services.api_client import RvmApiClient
+from src.services.api_client import RvmApiClient
+from _json_out import BAR, DASH, write_json
+from _mock_data import MICROCONTROLLER, CAMERAS, SENSORS, ACTUATORS, as_payload_dict
+
+PAYLOAD_BANNER_BYTES = ("\n" + BAR + "\n[MOCK] Complete Handshake Payload:\n" + BAR + "\n").encode()
 
 # Mock configuration - these would come from credentials.json in production
-MOCK_CONFIG = {
+MOCK_CONFIG = types.MappingProxyType({
     "base_url": "https://myrvm.penelitian.my.id/api/v1",
     "api_key": "MOCK_API_KEY_FOR_TESTING",
     "device_id": "MOCK-ORIN-SN-12345678",
     "name": "MOCK RVM Test Unit"
+})
+
+# Prefix trie of payload fields verified by test_mock_handshake; None marks a
+# leaf to report (list leaves report their length). Key order is report order.
+_TRIE = {
+    "hardware_id": None,
+    "name": None,
+    "ip_local": None,
+    "ip_vpn": None,
+    "timezone": None,
+    "system": {
+        "jetpack_version": None,
+        "ai_models": {"model_name": None},
+    },
+    "hardware_info": {
+        "microcontroller": {"type": None},
+        "cameras": None,
+        "sensors": None,
+        "actuators": None,
+    },
+    "diagnostics": {"network_check": None},
+    "health_metrics": {"cpu_usage_percent": None},
 }
 
 
+def walk(trie, obj, prefix=""):
+    """Yield (dotted path, value) for every trie leaf in one pass over the payload."""
+    for key, sub in trie.items():
+        value = obj.get(key) if isinstance(obj, dict) else None
+        path = f"{prefix}.{key}" if prefix else key
+        if sub is None:
+            yield path, value
+        else:
+            yield from walk(sub, value, path)
+
+
+@functools.lru_cache(maxsize=1)
 def get_mock_system_info():
     """Return mock system info when hardware is not available."""
     return {
@@ -38,97 +78,18 @@ def get_mock_system_info():
     }
 
 
+@functools.lru_cache(maxsize=1)
 def get_mock_hardware_info():
     """Return mock hardware info when devices are not detected."""
     return {
-        "microcontroller": {
-            "type": "MOCK-ESP32",
-            "connection": "MOCK-UART",
-            "port": "/dev/MOCK-ttyTHS1",
-            "baud_rate": 115200,
-            "status": "MOCK-connected"
-        },
-        "cameras": [
-            {
-                "id": 0,
-                "path": "/dev/MOCK-video0",
-                "name": "MOCK Logitech C920",
-                "connection_type": "MOCK-USB",
-                "physical_location": "MOCK-usb-1.4:1.0",
-                "serial_number": "MOCK-SN-8F21",
-                "status": "MOCK-ready",
-                "capabilities": {
-                    "max_resolution": "1920x1080",
-                    "format": "MJPG",
-                    "fps": 30
-                },
-                "role": "object_detection"
-            }
-        ],
-        "sensors": [
-            {
-                "name": "MOCK_bin_ultrasonic",
-                "friendly_name": "MOCK Sensor Level Bak",
-                "model": "MOCK-HC-SR04",
-                "interface": "GPIO",
-                "pins": {"trigger": 12, "echo": 13},
-                "status": "MOCK-online",
-                "last_reading": "50",
-                "unit": "cm"
-            },
-            {
-                "name": "MOCK_intake_proximity",
-                "friendly_name": "MOCK Sensor Deteksi Masuk",
-                "model": "MOCK-IR-Obstacle",
-                "interface": "GPIO",
-                "pin": 18,
-                "active_level": "LOW",
-                "status": "MOCK-online",
-                "last_reading": "0",
-                "unit": "boolean"
-            },
-            {
-                "name": "MOCK_internal_temp",
-                "friendly_name": "MOCK Sensor Suhu Internal",
-                "model": "MOCK-DHT22",
-                "interface": "GPIO",
-                "pin": 4,
-                "status": "MOCK-online",
-                "last_reading": "28.5",
-                "unit": "°C"
-            }
-        ],
-        "actuators": [
-            {
-                "name": "MOCK_sorting_motor",
-                "friendly_name": "MOCK Motor Pemilah",
-                "model": "MOCK-Stepper-NEMA17",
-                "interface": "GPIO",
-                "driver": "TB6600",
-                "pins": {"step": 23, "dir": 24, "enable": 25},
-                "status": "MOCK-ok"
-            },
-            {
-                "name": "MOCK_door_lock",
-                "friendly_name": "MOCK Kunci Pintu",
-                "model": "MOCK-Solenoid-12V",
-                "interface": "GPIO",
-                "pin": 27,
-                "status": "MOCK-ok"
-            },
-            {
-                "name": "MOCK_status_led",
-                "friendly_name": "MOCK Lampu Indikator",
-                "model": "MOCK-RGB-LED-Strip",
-                "interface": "GPIO",
-                "pin": 10,
-                "last_reading": "green",
-                "status": "MOCK-ok"
-            }
-        ]
+        "microcontroller": as_payload_dict(MICROCONTROLLER),
+        "cameras": [as_payload_dict(camera) for camera in CAMERAS],
+        "sensors": [as_payload_dict(sensor) for sensor in SENSORS],
+        "actuators": [as_payload_dict(actuator) for actuator in ACTUATORS],
     }
 
 
+@functools.lru_cache(maxsize=1)
 def get_mock_diagnostics():
     """Return mock diagnostics results."""
     return {
@@ -139,6 +100,7 @@ def get_mock_diagnostics():
     }
 
 
+@functools.lru_cache(maxsize=1)
 def get_mock_health_metrics():
     """Return mock health metrics."""
     return {
@@ -149,8 +111,9 @@ def get_mock_health_metrics():
     }
 
 
+@functools.lru_cache(maxsize=1)
 def build_mock_payload():
-    """Build complete mock handshake payload."""
+    """Build complete mock handshake payload (cached: callers must not mutate it)."""
     return {
         # 1. Identity
         "hardware_id": MOCK_CONFIG["device_id"],
@@ -179,52 +142,43 @@ def build_mock_payload():
 
 
 def print_payload(payload, indent=0):
-    """Pretty print the payload structure."""
-    import json
-    print("\n" + "=" * 60)
-    print("[MOCK] Complete Handshake Payload:")
-    print("=" * 60)
-    print(json.dumps(payload, indent=2))
+    """Pretty print the payload structure under the [MOCK] banner."""
+    write_json(payload, PAYLOAD_BANNER_BYTES)
 
 
 def test_mock_handshake():
     """Test handshake with mock data."""
-    print("\n" + "=" * 60)
-    print("[MOCK TEST] Handshake Format Verification")
-    print("=" * 60)
+    # Collect output and emit each section with one write instead of a print per line
+    out = [
+        "\n" + BAR,
+        "[MOCK TEST] Handshake Format Verification",
+        BAR,
+    ]
+    sys.stdout.write("\n".join(out) + "\n")
     
     # Build mock payload
     payload = build_mock_payload()
     print_payload(payload)
     
     # Verify structure
-    print("\n" + "-" * 60)
-    print("[MOCK] Structure Verification:")
-    print("-" * 60)
-    
-    checks = [
-        ("hardware_id", payload.get("hardware_id")),
-        ("name", payload.get("name")),
-        ("ip_local", payload.get("ip_local")),
-        ("ip_vpn", payload.get("ip_vpn")),
-        ("timezone", payload.get("timezone")),
-        ("system.jetpack_version", payload.get("system", {}).get("jetpack_version")),
-        ("system.ai_models.model_name", payload.get("system", {}).get("ai_models", {}).get("model_name")),
-        ("hardware_info.microcontroller.type", payload.get("hardware_info", {}).get("microcontroller", {}).get("type")),
-        ("hardware_info.cameras", len(payload.get("hardware_info", {}).get("cameras", []))),
-        ("hardware_info.sensors", len(payload.get("hardware_info", {}).get("sensors", []))),
-        ("hardware_info.actuators", len(payload.get("hardware_info", {}).get("actuators", []))),
-        ("diagnostics.network_check", payload.get("diagnostics", {}).get("network_check")),
-        ("health_metrics.cpu_usage_percent", payload.get("health_metrics", {}).get("cpu_usage_percent")),
+    out = [
+        "\n" + DASH,
+        "[MOCK] Structure Verification:",
+        DASH,
     ]
     
-    for field, value in checks:
+    for field, value in walk(_TRIE, payload):
+        if isinstance(value, list):
+            value = len(value)
         status = "✅" if value else "❌"
-        print(f"  {status} {field}: {value}")
+        out.append(f"  {status} {field}: {value}")
     
-    print("\n" + "=" * 60)
-    print("[MOCK TEST] Complete!")
-    print("=" * 60)
+    out += [
+        "\n" + BAR,
+        "[MOCK TEST] Complete!",
+        BAR,
+    ]
+    sys.stdout.write("\n".join(out) + "\n")
     
     return payload
 
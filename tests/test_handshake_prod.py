@@ -7,29 +7,19 @@ kredensial asli yang dihasilkan oleh server.
 """
 
 import sys
-import os
-import json
+from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from src.services.api_client import RvmApiClient
-
-def print_json(data, title=""):
-    """Pretty print JSON data."""
-    if title:
-        print(f"\n{'='*60}")
-        print(f"  {title}")
-        print(f"{'='*60}")
-    print(json.dumps(data, indent=2, default=str))
+from _json_out import BAR70, BANNER70, print_json
 
 def run_production_handshake_test():
     """
     Test handshake dengan data produksi.
     """
-    print("\n" + "="*70)
-    print("  PRODUCTION HANDSHAKE TEST - RVM-Edge")
-    print("="*70)
+    print(BANNER70 + "  PRODUCTION HANDSHAKE TEST - RVM-Edge\n" + BAR70)
     
     # Production Credentials
     api_key = "Mpy2X292Yj0ByeY22HrvhS3lHLHEyJ5dLShUPKWdrDHM753oWQs5wwBzIu1s0VIk"
@@ -62,9 +52,7 @@ def run_production_handshake_test():
              print(f"[-] Status Code: {client.last_response.status_code}")
              print(f"[-] Body: {client.last_response.text}")
     
-    print("\n" + "="*70)
-    print("  TEST COMPLETED")
-    print("="*70 + "\n")
+    print(BANNER70 + "  TEST COMPLETED\n" + BAR70 + "\n")
 
 if __name__ == "__main__":
     run_production_handshake_test()
@@ -1,13 +1,13 @@
 import sys
-import os
 import json
 import time
+from pathlib import Path
 
-# Add src to path
-sys.path.append(os.path.join(os.getcwd(), 'src'))
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 try:
-    from services.api_client import RvmApiClient
+    from src.services.api_client import RvmApiClient
 except ImportError:
     print("Failed to import RvmApiClient")
     sys.exit(1)
@@ -0,0 +1,30 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.hardware.level_math import calculate_level
+from src.hardware.level_math_np import compute_level
+
+# (distance cm, expected fill %): 50cm is empty, 5cm is full
+LEVEL_CASES = [
+    (50, 0),    # Empty
+    (5, 100),   # Full
+    (27.5, 50), # Half
+    (60, 0),    # Overflow empty
+    (2, 100),   # Overflow full
+]
+
+
+@pytest.mark.parametrize("dist,expected", LEVEL_CASES)
+def test_level(dist, expected):
+    assert calculate_level(dist) == expected
+    assert compute_level([dist])[0] == expected
+
+
+def test_scalar_path_does_not_import_numpy():
+    # main.py imports level_math at boot; only level_math_np may pull in numpy
+    code = "import sys, src.hardware.level_math; sys.exit('numpy' in sys.modules)"
+    root = Path(__file__).resolve().parents[1]
+    assert subprocess.run([sys.executable, "-c", code], cwd=root).returncode == 0
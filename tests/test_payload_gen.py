@@ -1,26 +1,34 @@
 import sys
-import os
-import json
+from pathlib import Path
 
-# Add src to path
-sys.path.append(os.path.join(os.getcwd(), 'src'))
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-try:
-    from services.api_client import RvmApiClient
-except ImportError:
-    # Try adjusting path if running from root
-    sys.path.append(os.path.join(os.getcwd(), 'MyRVM-Edge/src'))
+from _json_out import print_json
+
+def test_system_info(mock_client):
+    print("\n--- SYSTEM INFO ---")
+    info = mock_client._get_system_info()
+    print_json(info)
+    assert {"python_version", "firmware_version", "jetpack_version", "ai_models"} <= info.keys()
+
+
+def test_hardware_info(mock_client):
+    print("\n--- HARDWARE INFO ---")
+    info = mock_client._get_hardware_info()
+    print_json(info)
+    assert {"cameras", "microcontroller", "sensors", "actuators"} <= info.keys()
+    assert isinstance(info["cameras"], list)
+
+
+if __name__ == "__main__":
     try:
-        from services.api_client import RvmApiClient
+        from src.services.api_client import RvmApiClient
     except ImportError as e:
         print(f"Error importing RvmApiClient: {e}")
         sys.exit(1)
 
-# Mock client
-client = RvmApiClient("http://localhost", "test_key", "DEVICE_123")
-
-print("\n--- SYSTEM INFO ---")
-print(json.dumps(client._get_system_info(), indent=2))
-
-print("\n--- HARDWARE INFO ---")
-print(json.dumps(client._get_hardware_info(), indent=2))
+    # Mock client
+    client = RvmApiClient("http://localhost", "test_key", "DEVICE_123")
+    test_system_info(client)
+    test_hardware_info(client)
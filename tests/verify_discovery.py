@@ -1,9 +1,9 @@
 import sys
-import os
 import json
+from pathlib import Path
 
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from src.hardware.hardware_manager import HardwareManager
 